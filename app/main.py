@@ -1,28 +1,177 @@
-from flask import Flask, jsonify, request
-from flask_cors import CORS
+from flask import Flask, request
+from collections import defaultdict
 from datetime import datetime
-import json
+from functools import lru_cache
+import gzip
+import hashlib
+import mmap
 import os
+import sys
+import time
 
-from flasgger import Swagger
+import orjson
+from werkzeug.routing import IntegerConverter
 
 app = Flask(__name__)
-Swagger(app)
 
+# Flasgger eagerly walks every route to build its spec; only pay that
+# startup and per-request cost when the docs UI is actually wanted
+if os.getenv('FLASK_ENV') == 'development':
+    from flasgger import Swagger
+    Swagger(app)
+
+# Route converter matching integers >= 1, so bad page numbers are rejected in
+# Werkzeug's routing layer before any handler code runs
+class PositiveIntConverter(IntegerConverter):
+    def __init__(self, map):
+        super().__init__(map, min=1)
+
+app.url_map.converters['pint'] = PositiveIntConverter
+
+
+# orjson-backed replacement for flask.jsonify (2-5x faster serialization)
+def ojsonify(payload, status=200):
+    return app.response_class(
+        orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS),
+        status=status,
+        mimetype='application/json'
+    )
+
+
+# mmap the data files and parse the buffer directly, avoiding the extra
+# read()-into-bytes copy on startup
+def load_json_file(path):
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return orjson.loads(memoryview(mm))
 
 # Sample data (replace with your actual data source)
 data_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'dashboard_data.json')
-with open(data_path, 'r', encoding='utf-8') as f:
-    DASHBOARD_DATA = json.load(f)
+DASHBOARD_DATA = load_json_file(data_path)
+
+# Rebuild each action item with interned keys so the repeated field names
+# ('post_id', 'text', 'category', ...) share one string object per key
+# instead of one per item, shrinking the resident working set
+DASHBOARD_DATA['action_items'] = [
+    {sys.intern(k): v for k, v in item.items()}
+    for item in DASHBOARD_DATA['action_items']
+]
+
+# Helper function to get current timestamp, cached at 0.5s granularity so
+# repeat calls within a tick skip the datetime allocation and ISO formatting
+_TS_CACHE = ['', 0.0]
 
-# Helper function to get current timestamp
 def get_current_timestamp():
-    return datetime.now().isoformat()
+    now = time.time()
+    if now - _TS_CACHE[1] > 0.5:
+        _TS_CACHE[0] = datetime.now().isoformat()
+        _TS_CACHE[1] = now
+    return _TS_CACHE[0]
+
+# Pre-serialized response bodies for endpoints that serve constant slices of
+# the loaded data. The timestamp is baked in at build time (when the data was
+# loaded), which keeps the bodies fully static so gzip variants can be
+# precompressed once instead of per request.
+_STATIC_RESPONSES = {}
+_STATIC_RESPONSES_GZ = {}
+_ETAGS = {}
+
+def cache_static_response(key, data):
+    body = orjson.dumps({
+        'success': True,
+        'data': data,
+        'timestamp': get_current_timestamp()
+    }, option=orjson.OPT_NON_STR_KEYS)
+    _STATIC_RESPONSES[key] = body
+    _STATIC_RESPONSES_GZ[key] = gzip.compress(body, 6)
+    _ETAGS[key] = hashlib.blake2b(body, digest_size=12).hexdigest()
+
+def static_response(key):
+    # Let polling clients skip the body entirely when nothing changed
+    etag = _ETAGS[key]
+    if request.headers.get('If-None-Match') == etag:
+        return '', 304
+    headers = {'ETag': etag, 'Cache-Control': 'no-cache', 'Vary': 'Accept-Encoding'}
+    if 'gzip' in request.headers.get('Accept-Encoding', ''):
+        body = _STATIC_RESPONSES_GZ[key]
+        headers['Content-Encoding'] = 'gzip'
+    else:
+        body = _STATIC_RESPONSES[key]
+    return app.response_class(body, mimetype='application/json', headers=headers)
+
+for _key, _data in [
+    ('ai_overview', DASHBOARD_DATA['ai_overview']),
+    ('ai_overview_complaints', {'complaints': DASHBOARD_DATA['ai_overview']['complaints']}),
+    ('ai_overview_inquiries', {'inquiry': DASHBOARD_DATA['ai_overview']['inquiry']}),
+    ('ai_overview_praise', {'praise': DASHBOARD_DATA['ai_overview']['praise']}),
+    ('ai_overview_suggestions', {'suggestions': DASHBOARD_DATA['ai_overview']['suggestions']}),
+    ('bank_mentions', DASHBOARD_DATA['bank_mentions']),
+    ('kpi', DASHBOARD_DATA['kpi']),
+    ('geolocation', DASHBOARD_DATA['post_geolocation']),
+    ('scraping_status', DASHBOARD_DATA['scraping_status']),
+    ('sentiment_analysis', DASHBOARD_DATA['sentiment_analysis']),
+    ('emotion_distribution', DASHBOARD_DATA['sentiment_analysis']['emotion_distribution']),
+    ('post_categories', DASHBOARD_DATA['sentiment_analysis']['post_categories']),
+    ('sentiment_distribution', DASHBOARD_DATA['sentiment_analysis']['sentiment_distribution']),
+]:
+    cache_static_response(_key, _data)
+
+def _top_percent(distribution):
+    """Return the (name, 'NN%') pair with the highest percentage."""
+    return max(distribution.items(), key=lambda x: int(x[1].replace('%', '')))
+
+# The summary only derives from DASHBOARD_DATA, which never mutates at
+# runtime, so build it once instead of re-running the max() scans per request
+cache_static_response('summary', {
+    'total_action_items': len(DASHBOARD_DATA['action_items']),
+    'total_bank_mentions': DASHBOARD_DATA['bank_mentions']['total_bank_mentions'],
+    'prime_bank_mentions': DASHBOARD_DATA['bank_mentions']['prime_bank'],
+    'sentiment_score': DASHBOARD_DATA['kpi']['bank_sentiment_score'],
+    'posts_scraped': DASHBOARD_DATA['scraping_status']['posts_scraped'],
+    'scraping_status': DASHBOARD_DATA['scraping_status']['status'],
+    'top_emotion': _top_percent(DASHBOARD_DATA['sentiment_analysis']['emotion_distribution']),
+    'dominant_sentiment': _top_percent(DASHBOARD_DATA['sentiment_analysis']['sentiment_distribution'])
+})
+
+# O(1) lookup table for /api/action-items/<post_id>
+_ACTION_ITEMS_BY_ID = {item['post_id']: item for item in DASHBOARD_DATA['action_items']}
+
+# Pre-bucketed filter indexes for /api/action-items, keyed lowercase so the
+# per-request work is a dict lookup instead of a full scan with lowercasing
+_ITEMS_BY_CATEGORY = defaultdict(list)
+_ITEMS_BY_SENTIMENT = defaultdict(list)
+_ITEMS_BY_CAT_SENT = defaultdict(list)
+for _item in DASHBOARD_DATA['action_items']:
+    _cat = _item.get('category', '').lower()
+    _sent = _item.get('sentiment', '').lower()
+    _ITEMS_BY_CATEGORY[_cat].append(_item)
+    _ITEMS_BY_SENTIMENT[_sent].append(_item)
+    _ITEMS_BY_CAT_SENT[(_cat, _sent)].append(_item)
+
+# Freeze the buckets: plain dicts of tuples are compact, safe against
+# accidental defaultdict key creation, and slice without growth slack
+_ITEMS_BY_CATEGORY = {k: tuple(v) for k, v in _ITEMS_BY_CATEGORY.items()}
+_ITEMS_BY_SENTIMENT = {k: tuple(v) for k, v in _ITEMS_BY_SENTIMENT.items()}
+_ITEMS_BY_CAT_SENT = {k: tuple(v) for k, v in _ITEMS_BY_CAT_SENT.items()}
+
+# Search corpus for /api/search: one pre-lowercased blob per item, plus a
+# 3-char shingle inverted index so queries only substring-test candidates
+_SEARCH_BLOBS = []
+_SEARCH_SHINGLES = defaultdict(set)
+for _idx, _item in enumerate(DASHBOARD_DATA['action_items']):
+    _blob = ' '.join((
+        _item.get('text', ''),
+        _item.get('keywords', ''),
+        _item.get('author_name', '')
+    )).lower()
+    _SEARCH_BLOBS.append(_blob)
+    for _i in range(len(_blob) - 2):
+        _SEARCH_SHINGLES[_blob[_i:_i + 3]].add(_idx)
 
 # Error handler
 @app.errorhandler(404)
 def not_found(error):
-    return jsonify({
+    return ojsonify({
         'error': 'Endpoint not found',
         'message': 'The requested resource was not found on this server.',
         'timestamp': get_current_timestamp()
@@ -30,602 +179,333 @@ def not_found(error):
 
 @app.errorhandler(500)
 def internal_error(error):
-    return jsonify({
+    return ojsonify({
         'error': 'Internal server error',
         'message': 'An internal server error occurred.',
         'timestamp': get_current_timestamp()
     }), 500
 
+# Single catch-all so individual handlers don't need their own try/except
+@app.errorhandler(Exception)
+def unhandled_exception(e):
+    app.logger.exception(e)
+    return ojsonify({
+        'success': False,
+        'error': str(e),
+        'timestamp': get_current_timestamp()
+    }), 500
+
 # Root endpoint - Health check
 @app.route('/', methods=['GET'])
 def health_check():
-    return jsonify({
+    return ojsonify({
         'status': 'API is running',
         'timestamp': get_current_timestamp(),
         'version': '1.0.0'
     })
 
-# Get all dashboard data
+# Get all dashboard data. Everything except last_updated is static, so the
+# bulk of the body is serialized once and the fresh fields spliced in per
+# request instead of copying and re-serializing the whole dict.
+_DASHBOARD_PREFIX = (
+    b'{"success":true,"data":'
+    + orjson.dumps(
+        {k: v for k, v in DASHBOARD_DATA.items() if k != 'last_updated'},
+        option=orjson.OPT_NON_STR_KEYS)[:-1]
+    + b',"last_updated":"'
+)
+
 @app.route('/api/dashboard', methods=['GET'])
 def get_dashboard_data():
     """Get complete dashboard data"""
-    try:
-        response_data = DASHBOARD_DATA.copy()
-        response_data['last_updated'] = get_current_timestamp()
-        return jsonify({
-            'success': True,
-            'data': response_data,
-            'timestamp': get_current_timestamp()
-        })
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e),
-            'timestamp': get_current_timestamp()
-        }), 500
+    ts = get_current_timestamp().encode()
+    body = _DASHBOARD_PREFIX + ts + b'"},"timestamp":"' + ts + b'"}'
+    return app.response_class(body, mimetype='application/json')
 
 # Action Items Endpoints
+@lru_cache(maxsize=256)
+def _filtered_items_body(category, sentiment, limit):
+    """Build the response bytes for one filter combination; the underlying
+    data is immutable, so identical requests reuse the cached bytes."""
+    # Serve from the pre-bucketed indexes built at startup
+    if category and sentiment:
+        action_items = _ITEMS_BY_CAT_SENT.get((category.lower(), sentiment.lower()), ())
+    elif category:
+        action_items = _ITEMS_BY_CATEGORY.get(category.lower(), ())
+    elif sentiment:
+        action_items = _ITEMS_BY_SENTIMENT.get(sentiment.lower(), ())
+    else:
+        action_items = DASHBOARD_DATA['action_items']
+
+    # Apply limit
+    if limit:
+        action_items = action_items[:limit]
+
+    return orjson.dumps({
+        'success': True,
+        'data': action_items,
+        'count': len(action_items),
+        'timestamp': get_current_timestamp()
+    }, option=orjson.OPT_NON_STR_KEYS)
+
 @app.route('/api/action-items', methods=['GET'])
 def get_action_items():
     """Get all action items with optional filtering"""
-    try:
-        # Query parameters for filtering
-        category = request.args.get('category')
-        sentiment = request.args.get('sentiment')
-        limit = request.args.get('limit', type=int)
-        
-        action_items = DASHBOARD_DATA['action_items']
-        
-        # Apply filters
-        if category:
-            action_items = [item for item in action_items if item.get('category', '').lower() == category.lower()]
-        
-        if sentiment:
-            action_items = [item for item in action_items if item.get('sentiment', '').lower() == sentiment.lower()]
-        
-        # Apply limit
-        if limit:
-            action_items = action_items[:limit]
-        
-        return jsonify({
-            'success': True,
-            'data': action_items,
-            'count': len(action_items),
-            'timestamp': get_current_timestamp()
-        })
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e),
-            'timestamp': get_current_timestamp()
-        }), 500
+    # Query parameters for filtering
+    category = request.args.get('category')
+    sentiment = request.args.get('sentiment')
+    limit = request.args.get('limit', type=int)
+
+    body = _filtered_items_body(category, sentiment, limit)
+    return app.response_class(body, mimetype='application/json')
 
 @app.route('/api/action-items/<post_id>', methods=['GET'])
 def get_action_item_by_id(post_id):
     """Get specific action item by post ID"""
-    try:
-        action_item = next((item for item in DASHBOARD_DATA['action_items'] if item['post_id'] == post_id), None)
-        
-        if not action_item:
-            return jsonify({
-                'success': False,
-                'error': 'Action item not found',
-                'timestamp': get_current_timestamp()
-            }), 404
-        
-        return jsonify({
-            'success': True,
-            'data': action_item,
-            'timestamp': get_current_timestamp()
-        })
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e),
-            'timestamp': get_current_timestamp()
-        }), 500
-
-# AI Overview Endpoints
-@app.route('/api/ai-overview', methods=['GET'])
-def get_ai_overview():
-    """Get complete AI overview"""
-    try:
-        return jsonify({
-            'success': True,
-            'data': DASHBOARD_DATA['ai_overview'],
-            'timestamp': get_current_timestamp()
-        })
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e),
-            'timestamp': get_current_timestamp()
-        }), 500
-
-@app.route('/api/ai-overview/complaints', methods=['GET'])
-def get_complaints_analysis():
-    """Get complaints analysis"""
-    try:
-        return jsonify({
-            'success': True,
-            'data': {
-                'complaints': DASHBOARD_DATA['ai_overview']['complaints']
-            },
-            'timestamp': get_current_timestamp()
-        })
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e),
-            'timestamp': get_current_timestamp()
-        }), 500
-
-@app.route('/api/ai-overview/inquiries', methods=['GET'])
-def get_inquiries_analysis():
-    """Get inquiries analysis"""
-    try:
-        return jsonify({
-            'success': True,
-            'data': {
-                'inquiry': DASHBOARD_DATA['ai_overview']['inquiry']
-            },
-            'timestamp': get_current_timestamp()
-        })
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e),
-            'timestamp': get_current_timestamp()
-        }), 500
-
-@app.route('/api/ai-overview/praise', methods=['GET'])
-def get_praise_analysis():
-    """Get praise analysis"""
-    try:
-        return jsonify({
-            'success': True,
-            'data': {
-                'praise': DASHBOARD_DATA['ai_overview']['praise']
-            },
-            'timestamp': get_current_timestamp()
-        })
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e),
-            'timestamp': get_current_timestamp()
-        }), 500
-
-@app.route('/api/ai-overview/suggestions', methods=['GET'])
-def get_suggestions_analysis():
-    """Get AI suggestions"""
-    try:
-        return jsonify({
-            'success': True,
-            'data': {
-                'suggestions': DASHBOARD_DATA['ai_overview']['suggestions']
-            },
-            'timestamp': get_current_timestamp()
-        })
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e),
-            'timestamp': get_current_timestamp()
-        }), 500
-
-# Bank Mentions Endpoints
-@app.route('/api/bank-mentions', methods=['GET'])
-def get_bank_mentions():
-    """Get bank mentions data"""
-    try:
-        return jsonify({
-            'success': True,
-            'data': DASHBOARD_DATA['bank_mentions'],
-            'timestamp': get_current_timestamp()
-        })
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e),
-            'timestamp': get_current_timestamp()
-        }), 500
-
-# KPI Endpoints
-@app.route('/api/kpi', methods=['GET'])
-def get_kpi():
-    """Get KPI metrics"""
-    try:
-        return jsonify({
-            'success': True,
-            'data': DASHBOARD_DATA['kpi'],
-            'timestamp': get_current_timestamp()
-        })
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e),
-            'timestamp': get_current_timestamp()
-        }), 500
-
-# Geolocation Endpoints
-@app.route('/api/geolocation', methods=['GET'])
-def get_geolocation_data():
-    """Get post geolocation distribution"""
-    try:
-        return jsonify({
-            'success': True,
-            'data': DASHBOARD_DATA['post_geolocation'],
-            'timestamp': get_current_timestamp()
-        })
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e),
-            'timestamp': get_current_timestamp()
-        }), 500
-
-# Scraping Status Endpoints
-@app.route('/api/scraping-status', methods=['GET'])
-def get_scraping_status():
-    """Get scraping status information"""
-    try:
-        return jsonify({
-            'success': True,
-            'data': DASHBOARD_DATA['scraping_status'],
-            'timestamp': get_current_timestamp()
-        })
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e),
-            'timestamp': get_current_timestamp()
-        }), 500
-
-# Sentiment Analysis Endpoints
-@app.route('/api/sentiment-analysis', methods=['GET'])
-def get_sentiment_analysis():
-    """Get complete sentiment analysis"""
-    try:
-        return jsonify({
-            'success': True,
-            'data': DASHBOARD_DATA['sentiment_analysis'],
-            'timestamp': get_current_timestamp()
-        })
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e),
-            'timestamp': get_current_timestamp()
-        }), 500
-
-@app.route('/api/sentiment-analysis/emotions', methods=['GET'])
-def get_emotion_distribution():
-    """Get emotion distribution"""
-    try:
-        return jsonify({
-            'success': True,
-            'data': DASHBOARD_DATA['sentiment_analysis']['emotion_distribution'],
-            'timestamp': get_current_timestamp()
-        })
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e),
-            'timestamp': get_current_timestamp()
-        }), 500
-
-@app.route('/api/sentiment-analysis/categories', methods=['GET'])
-def get_post_categories():
-    """Get post categories distribution"""
-    try:
-        return jsonify({
-            'success': True,
-            'data': DASHBOARD_DATA['sentiment_analysis']['post_categories'],
-            'timestamp': get_current_timestamp()
-        })
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e),
-            'timestamp': get_current_timestamp()
-        }), 500
-
-@app.route('/api/sentiment-analysis/sentiments', methods=['GET'])
-def get_sentiment_distribution():
-    """Get sentiment distribution"""
-    try:
-        return jsonify({
-            'success': True,
-            'data': DASHBOARD_DATA['sentiment_analysis']['sentiment_distribution'],
-            'timestamp': get_current_timestamp()
-        })
-    except Exception as e:
-        return jsonify({
+    action_item = _ACTION_ITEMS_BY_ID.get(post_id)
+
+    if not action_item:
+        return ojsonify({
             'success': False,
-            'error': str(e),
+            'error': 'Action item not found',
             'timestamp': get_current_timestamp()
-        }), 500
+        }), 404
+
+    return ojsonify({
+        'success': True,
+        'data': action_item,
+        'timestamp': get_current_timestamp()
+    })
+
+# Static endpoints differ only in which cached payload they serve; register
+# them table-driven through one shared handler so the caching, ETag and
+# compression layers live in a single place
+_STATIC_ENDPOINTS = [
+    ('/api/ai-overview', 'get_ai_overview', 'ai_overview'),
+    ('/api/ai-overview/complaints', 'get_complaints_analysis', 'ai_overview_complaints'),
+    ('/api/ai-overview/inquiries', 'get_inquiries_analysis', 'ai_overview_inquiries'),
+    ('/api/ai-overview/praise', 'get_praise_analysis', 'ai_overview_praise'),
+    ('/api/ai-overview/suggestions', 'get_suggestions_analysis', 'ai_overview_suggestions'),
+    ('/api/bank-mentions', 'get_bank_mentions', 'bank_mentions'),
+    ('/api/kpi', 'get_kpi', 'kpi'),
+    ('/api/geolocation', 'get_geolocation_data', 'geolocation'),
+    ('/api/scraping-status', 'get_scraping_status', 'scraping_status'),
+    ('/api/sentiment-analysis', 'get_sentiment_analysis', 'sentiment_analysis'),
+    ('/api/sentiment-analysis/emotions', 'get_emotion_distribution', 'emotion_distribution'),
+    ('/api/sentiment-analysis/categories', 'get_post_categories', 'post_categories'),
+    ('/api/sentiment-analysis/sentiments', 'get_sentiment_distribution', 'sentiment_distribution'),
+    ('/api/summary', 'get_dashboard_summary', 'summary'),
+    ('/api/dashboard-ai-overview', 'get_dashboard_ai_overview', 'dashboard_ai_overview'),
+]
+
+def _make_static_handler(key):
+    def handler():
+        """Serve a pre-serialized slice of the dashboard data."""
+        return static_response(key)
+    return handler
+
+for _url, _name, _key in _STATIC_ENDPOINTS:
+    app.add_url_rule(_url, _name, _make_static_handler(_key))
 
 @app.route('/api/sentiment-analysis/top-posts', methods=['GET'])
 def get_top_posts():
     """Get top posts with optional limit"""
-    try:
-        limit = request.args.get('limit', default=10, type=int)
-        top_posts = DASHBOARD_DATA['sentiment_analysis'].get('top_posts', [])
-        
-        if limit:
-            top_posts = top_posts[:limit]
-        
-        return jsonify({
-            'success': True,
-            'data': top_posts,
-            'count': len(top_posts),
-            'timestamp': get_current_timestamp()
-        })
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e),
-            'timestamp': get_current_timestamp()
-        }), 500
-
-# Statistics and Summary Endpoints
-@app.route('/api/summary', methods=['GET'])
-def get_dashboard_summary():
-    """Get dashboard summary statistics"""
-    try:
-        summary = {
-            'total_action_items': len(DASHBOARD_DATA['action_items']),
-            'total_bank_mentions': DASHBOARD_DATA['bank_mentions']['total_bank_mentions'],
-            'prime_bank_mentions': DASHBOARD_DATA['bank_mentions']['prime_bank'],
-            'sentiment_score': DASHBOARD_DATA['kpi']['bank_sentiment_score'],
-            'posts_scraped': DASHBOARD_DATA['scraping_status']['posts_scraped'],
-            'scraping_status': DASHBOARD_DATA['scraping_status']['status'],
-            'top_emotion': max(DASHBOARD_DATA['sentiment_analysis']['emotion_distribution'].items(), key=lambda x: int(x[1].replace('%', ''))),
-            'dominant_sentiment': max(DASHBOARD_DATA['sentiment_analysis']['sentiment_distribution'].items(), key=lambda x: int(x[1].replace('%', '')))
-        }
-        
-        return jsonify({
-            'success': True,
-            'data': summary,
-            'timestamp': get_current_timestamp()
-        })
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e),
-            'timestamp': get_current_timestamp()
-        }), 500
+    limit = request.args.get('limit', default=10, type=int)
+    top_posts = DASHBOARD_DATA['sentiment_analysis'].get('top_posts', [])
+
+    if limit:
+        top_posts = top_posts[:limit]
+
+    return ojsonify({
+        'success': True,
+        'data': top_posts,
+        'count': len(top_posts),
+        'timestamp': get_current_timestamp()
+    })
 
 # Search endpoint
 @app.route('/api/search', methods=['GET'])
 def search_posts():
     """Search through action items"""
-    try:
-        query = request.args.get('q', '').lower()
-        if not query:
-            return jsonify({
-                'success': False,
-                'error': 'Search query is required',
-                'timestamp': get_current_timestamp()
-            }), 400
-        
-        results = []
-        for item in DASHBOARD_DATA['action_items']:
-            if (query in item.get('text', '').lower() or 
-                query in item.get('keywords', '').lower() or
-                query in item.get('author_name', '').lower()):
-                results.append(item)
-        
-        return jsonify({
-            'success': True,
-            'data': results,
-            'count': len(results),
-            'query': query,
-            'timestamp': get_current_timestamp()
-        })
-    except Exception as e:
-        return jsonify({
+    query = request.args.get('q', '').lower()
+    if not query:
+        return ojsonify({
             'success': False,
-            'error': str(e),
-            'timestamp': get_current_timestamp()
-        }), 500
-    
+            'error': 'Search query is required',
+            'timestamp': get_current_timestamp()
+        }), 400
+
+    action_items = DASHBOARD_DATA['action_items']
+    if len(query) >= 3:
+        # Intersect shingle posting sets to narrow down candidates,
+        # then confirm with an exact substring test on the blob
+        candidates = None
+        for i in range(len(query) - 2):
+            postings = _SEARCH_SHINGLES.get(query[i:i + 3])
+            if not postings:
+                candidates = set()
+                break
+            candidates = postings if candidates is None else candidates & postings
+        results = [action_items[idx] for idx in sorted(candidates) if query in _SEARCH_BLOBS[idx]]
+    else:
+        results = [action_items[idx] for idx, blob in enumerate(_SEARCH_BLOBS) if query in blob]
+
+    return ojsonify({
+        'success': True,
+        'data': results,
+        'count': len(results),
+        'query': query,
+        'timestamp': get_current_timestamp()
+    })
 
 ##ai_overview_path
 ai_overview_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'dashboard_ai_overview.json')
-with open(ai_overview_path, 'r', encoding='utf-8') as f:
-    DASHBOARD_AI_OVERVIEW = json.load(f)
-
-@app.route('/api/dashboard-ai-overview', methods=['GET'])
-def get_dashboard_ai_overview():
-    """Get dashboard AI overview data"""
-    try:
-        return jsonify({
-            'success': True,
-            'data': DASHBOARD_AI_OVERVIEW,
-            'timestamp': get_current_timestamp()
-        })
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e),
-            'timestamp': get_current_timestamp()
-        }), 500
+DASHBOARD_AI_OVERVIEW = load_json_file(ai_overview_path)
 
+cache_static_response('dashboard_ai_overview', DASHBOARD_AI_OVERVIEW)
 
 #full data path
 full_data_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'full_data.json')
-with open(full_data_path, 'r', encoding='utf-8') as f:
-    FULL_DATA = json.load(f)
-
-@app.route('/api/full-data/<page_no>', methods=['GET'])
-def get_full_data(page_no):
+with open(full_data_path, 'rb') as f:
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as _mm:
+        FULL_DATA = orjson.loads(memoryview(_mm))
+        # Content hash of the source file, used for per-page ETags
+        _FULL_DATA_ETAG = hashlib.blake2b(_mm, digest_size=12).hexdigest()
+
+# Pre-serialized page bodies: FULL_DATA never changes after load, so the
+# pagination math and per-page serialization run once here instead of on
+# every request
+_FULL_ITEMS_PER_PAGE = 50
+_SPLIT_ITEMS_PER_PAGE = 25
+
+def _page_body(items, pagination):
+    return orjson.dumps({
+        'success': True,
+        'data': {'items': items, 'pagination': pagination},
+        'timestamp': get_current_timestamp()
+    }, option=orjson.OPT_NON_STR_KEYS)
+
+_posts = FULL_DATA['Posts']
+_comments = FULL_DATA['Comments']
+_posts_len = len(_posts)
+_comments_len = len(_comments)
+
+# Combined feed pages (posts first, then comments), 50 items per page
+_combined = _posts + _comments
+_FULL_TOTAL_PAGES = (len(_combined) + _FULL_ITEMS_PER_PAGE - 1) // _FULL_ITEMS_PER_PAGE
+
+def _full_pagination(page):
+    return {
+        'current_page': page,
+        'total_pages': _FULL_TOTAL_PAGES,
+        'number_of_pages': _FULL_TOTAL_PAGES,
+        'items_per_page': _FULL_ITEMS_PER_PAGE,
+        'total_posts': _posts_len,
+        'total_comments': _comments_len
+    }
+
+_FULL_PAGES = [
+    _page_body(_combined[start:start + _FULL_ITEMS_PER_PAGE],
+               _full_pagination(start // _FULL_ITEMS_PER_PAGE + 1))
+    for start in range(0, len(_combined), _FULL_ITEMS_PER_PAGE)
+]
+
+# Posts-only pages, 25 items per page
+_POSTS_TOTAL_PAGES = (_posts_len + _SPLIT_ITEMS_PER_PAGE - 1) // _SPLIT_ITEMS_PER_PAGE
+
+def _posts_pagination(page):
+    return {
+        'current_page': page,
+        'total_pages': _POSTS_TOTAL_PAGES,
+        'number_of_pages': _POSTS_TOTAL_PAGES,
+        'items_per_page': _SPLIT_ITEMS_PER_PAGE,
+        'total_posts': _posts_len
+    }
+
+_POSTS_PAGES = [
+    _page_body(_posts[start:start + _SPLIT_ITEMS_PER_PAGE],
+               _posts_pagination(start // _SPLIT_ITEMS_PER_PAGE + 1))
+    for start in range(0, _posts_len, _SPLIT_ITEMS_PER_PAGE)
+]
+
+# Comments-only pages, 25 items per page
+_COMMENTS_TOTAL_PAGES = (_comments_len + _SPLIT_ITEMS_PER_PAGE - 1) // _SPLIT_ITEMS_PER_PAGE
+
+def _comments_pagination(page):
+    return {
+        'current_page': page,
+        'total_pages': _COMMENTS_TOTAL_PAGES,
+        'number_of_pages': _COMMENTS_TOTAL_PAGES,
+        'items_per_page': _SPLIT_ITEMS_PER_PAGE,
+        'total_comments': _comments_len
+    }
+
+_COMMENTS_PAGES = [
+    _page_body(_comments[start:start + _SPLIT_ITEMS_PER_PAGE],
+               _comments_pagination(start // _SPLIT_ITEMS_PER_PAGE + 1))
+    for start in range(0, _comments_len, _SPLIT_ITEMS_PER_PAGE)
+]
+
+# The page bodies above are the only thing the handlers touch; drop the
+# build-time concatenation so it doesn't sit in every worker's heap
+del _combined
+
+@app.route('/api/full-data/<pint:page>', methods=['GET'])
+def get_full_data(page):
     """Get full data from full_data.json with pagination (50 items per page, posts prioritized)"""
-    try:
-        # Convert page_no to integer and handle invalid input
-        try:
-            page = int(page_no)
-            if page < 1:
-                raise ValueError("Page number must be positive")
-        except ValueError as e:
-            return jsonify({
-                'success': False,
-                'error': str(e),
-                'timestamp': get_current_timestamp()
-            }), 400
-
-        items_per_page = 50
-        start_idx = (page - 1) * items_per_page
-        end_idx = start_idx + items_per_page
-
-        posts = FULL_DATA['Posts']
-        comments = FULL_DATA['Comments']
-        posts_len = len(posts)
-        comments_len = len(comments)
-
-        # Get posts for this page
-        posts_slice = posts[start_idx:end_idx] if start_idx < posts_len else []
-        num_posts = len(posts_slice)
-
-        # If not enough posts, fill with comments
-        if num_posts < items_per_page:
-            # Calculate how many more items needed
-            remaining = items_per_page - num_posts
-            # Comments start index: if posts are exhausted, comments should start at (start_idx - posts_len)
-            comments_start = max(0, start_idx - posts_len)
-            comments_end = comments_start + remaining
-            comments_slice = comments[comments_start:comments_end] if comments_start < comments_len else []
-        else:
-            comments_slice = []
-
-        # If posts are exhausted for this page, fill with comments only
-        if num_posts == 0:
-            comments_start = start_idx - posts_len
-            comments_end = comments_start + items_per_page
-            comments_slice = comments[comments_start:comments_end] if comments_start < comments_len else []
-
-        # Combine for response
-        combined_items = posts_slice + comments_slice
-
-        # Calculate total pages based on total items (posts + comments)
-        total_items = posts_len + comments_len
-        total_pages = (total_items + items_per_page - 1) // items_per_page
-
-        data_to_send = {
-            'items': combined_items,
-            'pagination': {
-                'current_page': page,
-                'total_pages': total_pages,
-                'number_of_pages': total_pages,
-                'items_per_page': items_per_page,
-                'total_posts': posts_len,
-                'total_comments': comments_len
-            }
-        }
-
-        return jsonify({
-            'success': True,
-            'data': data_to_send,
-            'timestamp': get_current_timestamp()
-        })
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e),
-            'timestamp': get_current_timestamp()
-        }), 500
-
-@app.route('/api/full-data/posts/<page_no>', methods=['GET'])
-def get_full_posts(page_no):
-    """Get paginated posts from full_data.json (50 per page)"""
-    try:
-        try:
-            page = int(page_no)
-            if page < 1:
-                raise ValueError("Page number must be positive")
-        except ValueError as e:
-            return jsonify({
-                'success': False,
-                'error': str(e),
-                'timestamp': get_current_timestamp()
-            }), 400
-
-        items_per_page = 25
-        posts = FULL_DATA['Posts']
-        posts_len = len(posts)
-        start_idx = (page - 1) * items_per_page
-        end_idx = start_idx + items_per_page
-        posts_slice = posts[start_idx:end_idx] if start_idx < posts_len else []
-        total_pages = (posts_len + items_per_page - 1) // items_per_page
-
-        data_to_send = {
-            'items': posts_slice,
-            'pagination': {
-                'current_page': page,
-                'total_pages': total_pages,
-                'number_of_pages': total_pages,
-                'items_per_page': items_per_page,
-                'total_posts': posts_len
-            }
-        }
-        return jsonify({
-            'success': True,
-            'data': data_to_send,
-            'timestamp': get_current_timestamp()
-        })
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e),
-            'timestamp': get_current_timestamp()
-        }), 500
-
-@app.route('/api/full-data/comments/<page_no>', methods=['GET'])
-def get_full_comments(page_no):
-    """Get paginated comments from full_data.json (50 per page)"""
-    try:
-        try:
-            page = int(page_no)
-            if page < 1:
-                raise ValueError("Page number must be positive")
-        except ValueError as e:
-            return jsonify({
-                'success': False,
-                'error': str(e),
-                'timestamp': get_current_timestamp()
-            }), 400
-
-        items_per_page = 25
-        comments = FULL_DATA['Comments']
-        comments_len = len(comments)
-        start_idx = (page - 1) * items_per_page
-        end_idx = start_idx + items_per_page
-        comments_slice = comments[start_idx:end_idx] if start_idx < comments_len else []
-        total_pages = (comments_len + items_per_page - 1) // items_per_page
-
-        data_to_send = {
-            'items': comments_slice,
-            'pagination': {
-                'current_page': page,
-                'total_pages': total_pages,
-                'number_of_pages': total_pages,
-                'items_per_page': items_per_page,
-                'total_comments': comments_len
-            }
-        }
-        return jsonify({
-            'success': True,
-            'data': data_to_send,
-            'timestamp': get_current_timestamp()
-        })
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e),
-            'timestamp': get_current_timestamp()
-        }), 500
+    # Pages of a fixed file are stable, so a file-hash + page ETag works
+    etag = f"{_FULL_DATA_ETAG}-full-{page}"
+    if request.headers.get('If-None-Match') == etag:
+        return '', 304
+
+    if page <= len(_FULL_PAGES):
+        body = _FULL_PAGES[page - 1]
+    else:
+        # Out-of-range pages keep returning an empty item list
+        body = _page_body([], _full_pagination(page))
+    return app.response_class(
+        body,
+        mimetype='application/json',
+        headers={'ETag': etag, 'Cache-Control': 'no-cache'}
+    )
+
+@app.route('/api/full-data/posts/<pint:page>', methods=['GET'])
+def get_full_posts(page):
+    """Get paginated posts from full_data.json (25 per page)"""
+    # Pages of a fixed file are stable, so a file-hash + page ETag works
+    etag = f"{_FULL_DATA_ETAG}-posts-{page}"
+    if request.headers.get('If-None-Match') == etag:
+        return '', 304
+
+    if page <= len(_POSTS_PAGES):
+        body = _POSTS_PAGES[page - 1]
+    else:
+        body = _page_body([], _posts_pagination(page))
+    return app.response_class(
+        body,
+        mimetype='application/json',
+        headers={'ETag': etag, 'Cache-Control': 'no-cache'}
+    )
+
+@app.route('/api/full-data/comments/<pint:page>', methods=['GET'])
+def get_full_comments(page):
+    """Get paginated comments from full_data.json (25 per page)"""
+    etag = f"{_FULL_DATA_ETAG}-comments-{page}"
+    if request.headers.get('If-None-Match') == etag:
+        return '', 304
+
+    if page <= len(_COMMENTS_PAGES):
+        body = _COMMENTS_PAGES[page - 1]
+    else:
+        body = _page_body([], _comments_pagination(page))
+    return app.response_class(
+        body,
+        mimetype='application/json',
+        headers={'ETag': etag, 'Cache-Control': 'no-cache'}
+    )
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=8080)
\ No newline at end of file
+    # Local development only; production serves wsgi:app under gunicorn with
+    # multiple workers/threads (see Dockerfile) so read-only endpoints scale
+    # across cores
+    app.run(debug=bool(os.getenv('FLASK_DEV')), host='0.0.0.0', port=8080)
\ No newline at end of file
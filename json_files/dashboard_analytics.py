@@ -8,25 +8,128 @@ Author: Facebook Group Scraper Project
 Date: 2025
 """
 
+import mmap
 import os
 import re
 import json
-import pickle
-import csv
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
-import openai
-from dotenv import load_dotenv
+import numpy as np
+import orjson
+import pandas as pd
 
-# Load environment variables
-load_dotenv()
+# Optional linear-time regex engine (google-re2) for the bank-mention scan;
+# the stdlib engine is used when it isn't installed
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# Optional fused-kernel evaluator for large-array arithmetic; plain NumPy is
+# used when it isn't installed or the arrays are small
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+# CSV parser engine: pyarrow's multi-threaded C++ parser when available,
+# otherwise pandas' default single-threaded C parser
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
+
+# Row count below which numexpr's threading overhead outweighs its gains
+NUMEXPR_MIN_ROWS = 10_000
+
+# How many top-virality posts are sent to the model for the AI overview
+AI_OVERVIEW_TOP_POSTS = 50
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Keyword lists for the fallback overview, with one combined alternation so
+# presence can be detected in a single scan instead of one full-text search
+# per keyword (longest-first so overlapping keywords match deterministically)
+FALLBACK_KEYWORDS = {
+    'inquiry': ['how', 'when', 'where', 'what', 'why', 'can i', 'help', 'support', '?'],
+    'praise': ['good', 'great', 'excellent', 'thank', 'appreciate', 'best', 'amazing', 'wonderful'],
+    'complaint': ['problem', 'issue', 'error', 'wrong', 'bad', 'terrible', 'slow', 'delay', 'frustrated']
+}
+_FALLBACK_KW_RE = re.compile('|'.join(
+    re.escape(k)
+    for k in sorted({k for kws in FALLBACK_KEYWORDS.values() for k in kws},
+                    key=len, reverse=True)
+))
+
+# Counting patterns for the fallback overview: a word is any whitespace-free
+# run, a sentence is any '.'-delimited segment containing visible text
+_WORD_RE = re.compile(r'\S+')
+_SENTENCE_RE = re.compile(r'[^.\s][^.]*')
+
+# Static instruction block for generate_ai_overview, built once at import
+# instead of re-assembled per call
+_AI_OVERVIEW_PROMPT = """
+            As an expert AI analyst, analyze the following Facebook posts about Prime Bank from a comprehensive AI perspective. 
+            Provide deep insights about what these posts reveal about Prime Bank's customer relationship, service quality, 
+            and market position. Be specific, detailed, and analytical.
+
+            Format your response as strict JSON only response with the following structure,if the response is not json it won't work. So the response must must must be json only:
+            {{
+                "inquiry": "detailed analysis of customer inquiries with specific patterns and insights",
+                "praise": "detailed analysis of customer praise with specific service strengths identified",
+                "complaints": "detailed analysis of customer complaints with root cause analysis", 
+                "suggestions": "detailed AI-driven recommendations based on customer feedback patterns"
+            }}
+            
+            For each category, provide 6-8 detailed bullet points in React-friendly markdown format. And You should include the name of Prime Bank in the analysis,
+            and the analysis should be specific to Prime Bank's services and customer's opinions.
+            Use **bold** for emphasis and include:
+            
+            INQUIRY ANALYSIS:
+            - Identify specific types of inquiries (account issues, service questions, technical problems)
+            - Analyze inquiry patterns and frequency
+            - Highlight most common customer pain points
+            - Assess the complexity level of customer queries
+            - Evaluate response time expectations from customers
+            - Note any recurring themes or seasonal patterns
+            
+            PRAISE ANALYSIS:
+            - Identify specific services or features customers appreciate most
+            - Analyze the language used in positive feedback
+            - Highlight staff performance and customer service quality
+            - Note any exceptional service experiences mentioned
+            - Identify competitive advantages based on customer feedback
+            - Assess customer loyalty indicators in the praise content
+            
+            COMPLAINTS ANALYSIS:
+            - Categorize complaints by type (technical, service, process, communication)
+            - Analyze severity and frequency of different complaint types
+            - Identify systemic issues vs. isolated incidents
+            - Evaluate customer frustration levels and escalation patterns
+            - Note any compliance or regulatory concerns mentioned
+            - Assess potential reputational risks from complaint patterns
+            
+            SUGGESTIONS (AI RECOMMENDATIONS):
+            - Provide actionable recommendations based on customer feedback analysis
+            - Suggest process improvements for most common issues
+            - Recommend technology upgrades or digital solutions
+            - Propose customer experience enhancements
+            - Suggest training programs for staff based on feedback patterns
+            - Recommend proactive communication strategies
+            - Propose competitive positioning improvements
+            
+            Make your analysis sound like it comes from an AI that has deep understanding of banking customer behavior, 
+            service excellence, and digital transformation trends. Be specific about what the data reveals about Prime Bank's position in the market.
+            
+            Posts content:
+            {content}
+            """
+
 class DashboardAnalytics:
     """Generate analytics data for the dashboard."""
     
@@ -51,12 +154,104 @@ class DashboardAnalytics:
             'city_bank': [r'city\s*bank', r'@citybank'],
             'dutch_bangla': [r'dutch\s*bangla', r'dbbl', r'@dutchbangla']
         }
-        
-        # OpenAI setup
+
+        # One combined regex with a named group per bank: mention counting
+        # becomes a single pass over the posts text instead of one per bank.
+        # Compiled as a bytes pattern so it can scan a memory-mapped file
+        # without decoding; the inline (?i) flag keeps it valid for both
+        # engines. _bank_group_names maps match.lastindex back to the bank.
+        mention_pattern = '(?i)' + '|'.join(
+            f"(?P<{bank}>{'|'.join(f'(?:{p})' for p in patterns)})"
+            for bank, patterns in self.bank_patterns.items()
+        )
+        engine = re2 if re2 is not None else re
+        self._bank_mention_re = engine.compile(mention_pattern.encode())
+        self._bank_group_names = tuple(self.bank_patterns)
+
+        # OpenAI setup; .env is only loaded when the key isn't already in
+        # the environment, and the openai import itself is deferred to
+        # generate_ai_overview so CSV-only callers skip its import cost
+        if not os.getenv('OPENAI_API_KEY'):
+            from dotenv import load_dotenv
+            load_dotenv()
         self.api_key = os.getenv('OPENAI_API_KEY')
-        if self.api_key:
-            openai.api_key = self.api_key
-    
+
+        # Persistent OpenAI client, created lazily on first AI call
+        self._openai_client = None
+
+        # Cached posts DataFrame, invalidated when the CSV file changes
+        self._posts_df = None
+        self._posts_df_key = None
+
+        # Memoized analytics results, keyed by source-file signature
+        self._cache = {}
+
+    def _cached(self, key, path, compute):
+        """
+        Memoize compute() under key, invalidated when the file at path
+        changes (mtime/size). Lets repeated dashboard requests reuse
+        results instead of re-aggregating identical data.
+
+        Args:
+            key: Cache key for this result
+            path: Source file whose signature gates the cache
+            compute: Zero-argument callable producing the result
+
+        Returns:
+            The cached or freshly computed result
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return compute()
+
+        sig = (st.st_mtime_ns, st.st_size)
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] == sig:
+            return entry[1]
+
+        value = compute()
+        self._cache[key] = (sig, value)
+        return value
+
+    def _load_posts_df(self) -> Optional[pd.DataFrame]:
+        """
+        Load the prime bank posts CSV as a DataFrame, cached on file
+        mtime/size so the analytics methods share one parse instead of
+        each re-reading the same file.
+
+        Returns:
+            DataFrame with coerced numeric columns, or None if the file is missing
+        """
+        csv_file = self.csv_dir / "prime_bank_facebook_posts_data.csv"
+
+        try:
+            st = os.stat(csv_file)
+        except OSError:
+            logger.warning(f"CSV file not found: {csv_file}")
+            return None
+
+        cache_key = (st.st_mtime_ns, st.st_size)
+        if self._posts_df is not None and self._posts_df_key == cache_key:
+            return self._posts_df
+
+        # dtype=str with keep_default_na=False keeps every column as the
+        # raw CSV string ('' for blanks, 'True'/'False' for flags), matching
+        # the old DictReader semantics; only the columns below are coerced.
+        # Narrow dtypes: counts and scores fit in 32 bits, and the
+        # low-cardinality label columns go categorical, halving the frame's
+        # footprint
+        df = pd.read_csv(csv_file, dtype=str, keep_default_na=False, engine=CSV_ENGINE)
+        for col in ('reaction_count', 'comments_count', 'share_count'):
+            df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0).astype('int32')
+        df['virality_score'] = pd.to_numeric(df['virality_score'], errors='coerce').fillna(0).astype('float32')
+        for col in ('category', 'sentiment', 'emotion'):
+            df[col] = df[col].astype('category')
+
+        self._posts_df = df
+        self._posts_df_key = cache_key
+        return df
+
     def get_post_categories_percentage(self) -> Dict:
         """
         Get post categories percentage from prime_bank_facebook_posts_data.csv
@@ -65,9 +260,12 @@ class DashboardAnalytics:
             Dictionary with category percentages
         """
         csv_file = self.csv_dir / "prime_bank_facebook_posts_data.csv"
-        
-        if not csv_file.exists():
-            logger.warning(f"CSV file not found: {csv_file}")
+        return self._cached('post_categories', csv_file, self._compute_post_categories_percentage)
+
+    def _compute_post_categories_percentage(self) -> Dict:
+        df = self._load_posts_df()
+
+        if df is None:
             return {
                 'inquiry': '0%',
                 'suggestions': '0%',
@@ -77,30 +275,26 @@ class DashboardAnalytics:
                 'total_number_of_posts': 0
             }
         
-        categories = {'inquiry': 0, 'suggestion': 0, 'complaint': 0, 'praise': 0, 'other': 0}
-        total_posts = 0
-        
         try:
-            with open(csv_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    total_posts += 1
-                    category = row.get('category', '').lower()
-                    if category in categories:
-                        categories[category] += 1
-                    else:
-                        categories['other'] += 1
-            
-            # Calculate percentages
+            # Counting happens vectorized in C instead of a per-row loop
+            total_posts = len(df)
+
             if total_posts > 0:
+                counts = df['category'].str.lower().value_counts()
+                known = counts.reindex(['inquiry', 'suggestion', 'complaint', 'praise'], fill_value=0)
+
                 result = {}
-                for cat, count in categories.items():
+                for cat, count in known.items():
                     # Convert 'suggestion' to 'suggestions' for output
                     output_key = 'suggestions' if cat == 'suggestion' else cat
-                    result[output_key] = f"{round((count / total_posts) * 100)}%"
+                    result[output_key] = f"{round((int(count) / total_posts) * 100)}%"
+                # Everything that isn't a known category (including blanks)
+                # counts as 'other'
+                other = total_posts - int(known.sum())
+                result['other'] = f"{round((other / total_posts) * 100)}%"
                 result['total_number_of_posts'] = total_posts
                 return result
-            
+
         except Exception as e:
             logger.error(f"Error reading CSV file: {e}")
         
@@ -121,39 +315,30 @@ class DashboardAnalytics:
             Dictionary with bank mention counts
         """
         posts_file = self.posts_dir / "other_banks" / "all_extracted_posts.txt"
-        
-        if not posts_file.exists():
-            logger.warning(f"Posts file not found: {posts_file}")
-            return {
-                'prime_bank': 0,
-                'eastern_bank': 0,
-                'brac_bank': 0,
-                'city_bank': 0,
-                'dutch_bangla': 0,
-                'total_bank_mentions': 0
-            }
-        
+        return self._cached('bank_mentions', posts_file, lambda: self._compute_bank_mentions(posts_file))
+
+    def _compute_bank_mentions(self, posts_file: Path) -> Dict:
         try:
-            with open(posts_file, 'r', encoding='utf-8') as f:
-                content = f.read().lower()
-            
-            bank_counts = {}
+            bank_counts = {bank: 0 for bank in self.bank_patterns}
             total_mentions = 0
-            
-            for bank_name, patterns in self.bank_patterns.items():
-                count = 0
-                for pattern in patterns:
-                    matches = re.findall(pattern, content, re.IGNORECASE)
-                    count += len(matches)
-                bank_counts[bank_name] = count
-                total_mentions += count
+
+            # Scan the file through mmap: the case-insensitive bytes pattern
+            # matches the buffer directly, with no decode or .lower() copy.
+            # Opening directly (no exists() probe) saves a stat syscall.
+            with open(posts_file, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    for match in self._bank_mention_re.finditer(mm):
+                        bank_counts[self._bank_group_names[match.lastindex - 1]] += 1
+                        total_mentions += 1
             
             bank_counts['total_bank_mentions'] = total_mentions
             return bank_counts
             
+        except FileNotFoundError:
+            logger.warning(f"Posts file not found: {posts_file}")
         except Exception as e:
             logger.error(f"Error reading posts file: {e}")
-            return {
+        return {
                 'prime_bank': 0,
                 'eastern_bank': 0,
                 'brac_bank': 0,
@@ -184,9 +369,12 @@ class DashboardAnalytics:
             Dictionary with sentiment analysis
         """
         csv_file = self.csv_dir / "prime_bank_facebook_posts_data.csv"
-        
-        if not csv_file.exists():
-            logger.warning(f"CSV file not found: {csv_file}")
+        return self._cached('sentiment_analysis', csv_file, self._compute_sentiment_analysis)
+
+    def _compute_sentiment_analysis(self) -> Dict:
+        df = self._load_posts_df()
+
+        if df is None:
             return {
                 'bank_sentiment_score': 0,
                 'engagement_weighted_sentiment': 0,
@@ -194,42 +382,26 @@ class DashboardAnalytics:
                 'emotion_distribution': {'neutral': '0%', 'joy': '0%', 'confusion': '0%', 'frustration': '0%'}
             }
         
-        positive_posts = 0
-        negative_posts = 0
-        neutral_posts = 0
-        total_virality = 0
-        emotions = {'neutral': 0, 'joy': 0, 'confusion': 0, 'frustration': 0}
-        total_posts = 0
-        
         try:
-            with open(csv_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    total_posts += 1
-                    
-                    # Count sentiments
-                    sentiment = row.get('sentiment', '').lower()
-                    if sentiment == 'positive':
-                        positive_posts += 1
-                    elif sentiment == 'negative':
-                        negative_posts += 1
-                    else:
-                        neutral_posts += 1
-                    
-                    # Sum virality scores
-                    try:
-                        virality = float(row.get('virality_score', 0))
-                        total_virality += virality
-                    except (ValueError, TypeError):
-                        pass
-                    
-                    # Count emotions
-                    emotion = row.get('emotion', '').lower()
-                    if emotion in emotions:
-                        emotions[emotion] += 1
-                    else:
-                        emotions['neutral'] += 1
-            
+            # One vectorized pass over the cached frame instead of a per-row
+            # loop with per-field lowercasing and float() try/except
+            total_posts = len(df)
+
+            sentiments = df['sentiment'].str.lower()
+            positive_posts = int((sentiments == 'positive').sum())
+            negative_posts = int((sentiments == 'negative').sum())
+            neutral_posts = total_posts - positive_posts - negative_posts
+
+            total_virality = float(df['virality_score'].sum())
+
+            emotions = {'neutral': 0, 'joy': 0, 'confusion': 0, 'frustration': 0}
+            emotion_counts = df['emotion'].str.lower().value_counts()
+            for emotion, count in emotion_counts.items():
+                if emotion in emotions:
+                    emotions[emotion] += int(count)
+                else:
+                    emotions['neutral'] += int(count)
+
             # Calculate percentages
             sentiment_dist = {}
             emotion_dist = {}
@@ -273,33 +445,18 @@ class DashboardAnalytics:
             List of top posts
         """
         csv_file = self.csv_dir / "prime_bank_facebook_posts_data.csv"
-        
-        if not csv_file.exists():
-            logger.warning(f"CSV file not found: {csv_file}")
+        return self._cached(('top_posts', limit), csv_file, lambda: self._compute_top_posts(limit))
+
+    def _compute_top_posts(self, limit: int) -> List[Dict]:
+        df = self._load_posts_df()
+
+        if df is None:
             return []
         
-        posts = []
-        
         try:
-            with open(csv_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    try:
-                        row['virality_score'] = float(row.get('virality_score', 0))
-                        row['reaction_count'] = int(row.get('reaction_count', 0))
-                        row['comments_count'] = int(row.get('comments_count', 0))
-                        row['share_count'] = int(row.get('share_count', 0))
-                    except (ValueError, TypeError):
-                        row['virality_score'] = 0
-                        row['reaction_count'] = 0
-                        row['comments_count'] = 0
-                        row['share_count'] = 0
-                    
-                    posts.append(row)
-            
-            # Sort by virality score and return top posts
-            posts.sort(key=lambda x: x['virality_score'], reverse=True)
-            return posts[:limit]
+            # Numeric columns are already coerced by _load_posts_df; only the
+            # winning rows get materialized into dicts
+            return df.nlargest(limit, 'virality_score').to_dict('records')
             
         except Exception as e:
             logger.error(f"Error getting top posts: {e}")
@@ -321,116 +478,101 @@ class DashboardAnalytics:
             posts_limit = int(os.getenv('ACTION_ITEMS_POSTS_LIMIT', 10))
         if comments_limit is None:
             comments_limit = int(os.getenv('ACTION_ITEMS_COMMENTS_LIMIT', 10))
-        posts_csv_file = self.csv_dir / "prime_bank_facebook_posts_data.csv"
         comments_csv_file = self.csv_dir / "prime_bank_comments_scraped.csv"
         
-        posts = []
-        comments = []
+        top_posts = []
+        top_comments = []
         
-        # Process all posts
-        if posts_csv_file.exists():
-            try:
-                with open(posts_csv_file, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        try:
-                            virality_score = float(row.get('virality_score', 0))
-                            reaction_count = int(row.get('reaction_count', 0))
-                            comments_count = int(row.get('comments_count', 0))
-                            share_count = int(row.get('share_count', 0))
-                        except (ValueError, TypeError):
-                            virality_score = 0
-                            reaction_count = 0
-                            comments_count = 0
-                            share_count = 0
-                        
-                        action_item = {
-                            'type': 'post',
-                            'post_routing_id': row.get('post_routing_id', ''),
-                            'text': row.get('text', ''),
-                            'author_name': row.get('author_name', ''),
-                            'sentiment': row.get('sentiment', ''),
-                            'emotion': row.get('emotion', ''),
-                            'category': row.get('category', ''),
-                            'virality_score': virality_score,
-                            'reaction_count': reaction_count,
-                            'comments_count': comments_count,
-                            'share_count': share_count,
-                            'post_url': row.get('post_url', ''),
-                            'post_id': row.get('post_id', ''),
-                            'keywords': row.get('keywords', ''),
-                            'topic_category': row.get('topic_category', ''),
-                            'timestamp': ''  # Posts don't have timestamp, use empty string for consistency
-                        }
-                        posts.append(action_item)
-                        
-            except Exception as e:
-                logger.error(f"Error getting action items from posts: {e}")
-        else:
-            logger.warning(f"Posts CSV file not found: {posts_csv_file}")
+        # Top posts come from the memoized get_top_posts records, so only
+        # the winning rows are ever materialized into dicts and a warm cache
+        # skips the selection entirely
+        try:
+            for row in self.get_top_posts(limit=posts_limit):
+                action_item = {
+                    'type': 'post',
+                    'post_routing_id': row.get('post_routing_id', ''),
+                    'text': row.get('text', ''),
+                    'author_name': row.get('author_name', ''),
+                    'sentiment': row.get('sentiment', ''),
+                    'emotion': row.get('emotion', ''),
+                    'category': row.get('category', ''),
+                    'virality_score': row['virality_score'],
+                    'reaction_count': row['reaction_count'],
+                    'comments_count': row['comments_count'],
+                    'share_count': row['share_count'],
+                    'post_url': row.get('post_url', ''),
+                    'post_id': row.get('post_id', ''),
+                    'keywords': row.get('keywords', ''),
+                    'topic_category': row.get('topic_category', ''),
+                    'timestamp': ''  # Posts don't have timestamp, use empty string for consistency
+                }
+                top_posts.append(action_item)
+                    
+        except Exception as e:
+            logger.error(f"Error getting action items from posts: {e}")
         
-        # Process all comments
-        if comments_csv_file.exists():
-            try:
-                with open(comments_csv_file, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        # Calculate virality score for comments: likes + comments*2
-                        try:
-                            likes_count = int(row.get('likes_count', 0) or 0)
-                            comment_replies = int(row.get('comments_count', 0) or 0)
-                            virality_score = likes_count + (comment_replies * 2)
-                        except (ValueError, TypeError):
-                            likes_count = 0
-                            comment_replies = 0
-                            virality_score = 0
-                        
-                        action_item = {
-                            'type': 'comment',
-                            'post_routing_id': row.get('post_routing_id', ''),
-                            'text': row.get('comment_text', ''),
-                            'author_name': row.get('author_name', ''),
-                            'sentiment': '',  # Comments don't have sentiment analysis yet
-                            'emotion': '',    # Comments don't have emotion analysis yet
-                            'category': '',   # Comments don't have category analysis yet
-                            'virality_score': virality_score,
-                            'reaction_count': likes_count,
-                            'comments_count': comment_replies,
-                            'share_count': 0,  # Comments don't have shares
-                            'post_url': row.get('post_url', ''),
-                            'post_id': row.get('comment_id', ''),
-                            'keywords': '',   # Comments don't have keyword analysis yet
-                            'topic_category': '',
-                            'comment_url': row.get('comment_url', ''),
-                            'timestamp': row.get('timestamp', '')
-                        }
-                        comments.append(action_item)
-                        
-            except Exception as e:
-                logger.error(f"Error getting action items from comments: {e}")
-        else:
+        # Process comments in bulk: vectorized coercion and virality, then
+        # dict construction only for the top-k rows; read_csv raising
+        # FileNotFoundError replaces the exists() probe
+        try:
+            # keep_default_na=False keeps string columns as plain '' for
+            # blanks, matching the old DictReader semantics
+            df_c = pd.read_csv(comments_csv_file, keep_default_na=False, engine=CSV_ENGINE)
+            likes = pd.to_numeric(df_c['likes_count'], errors='coerce').fillna(0).astype('int32')
+            replies = pd.to_numeric(df_c['comments_count'], errors='coerce').fillna(0).astype('int32')
+            df_c['likes_count'] = likes
+            df_c['comments_count'] = replies
+            # Virality score for comments: likes + replies*2, evaluated
+            # in one fused multi-threaded kernel when the CSV is large
+            # enough for that to pay off
+            if numexpr is not None and len(df_c) >= NUMEXPR_MIN_ROWS:
+                df_c['virality_score'] = numexpr.evaluate(
+                    'likes + 2 * replies',
+                    {'likes': likes.to_numpy(), 'replies': replies.to_numpy()}
+                )
+            else:
+                df_c['virality_score'] = likes + replies * 2
+            # Timestamp tiebreaker (latest first): parsed once for the
+            # whole column instead of per comparison; unparseable/blank
+            # stamps become NaT (int64 min), which must rank oldest even
+            # after negation, hence the explicit remap
+            ts = pd.to_datetime(
+                df_c['timestamp'], errors='coerce', utc=True, format='ISO8601'
+            ).astype('int64').to_numpy()
+            nat = np.iinfo(np.int64).min
+            neg_ts = np.where(ts == nat, np.iinfo(np.int64).max, -ts)
+            
+            # Stable lexsort on precomputed numeric keys (primary key
+            # last): highest virality first, latest timestamp breaks ties
+            order = np.lexsort((neg_ts, -df_c['virality_score'].to_numpy()))
+            winners = df_c.iloc[order[:comments_limit]]
+            
+            for row in winners.to_dict('records'):
+                action_item = {
+                    'type': 'comment',
+                    'post_routing_id': row.get('post_routing_id', ''),
+                    'text': row.get('comment_text', ''),
+                    'author_name': row.get('author_name', ''),
+                    'sentiment': '',  # Comments don't have sentiment analysis yet
+                    'emotion': '',    # Comments don't have emotion analysis yet
+                    'category': '',   # Comments don't have category analysis yet
+                    'virality_score': row['virality_score'],
+                    'reaction_count': row['likes_count'],
+                    'comments_count': row['comments_count'],
+                    'share_count': 0,  # Comments don't have shares
+                    'post_url': row.get('post_url', ''),
+                    'post_id': row.get('comment_id', ''),
+                    'keywords': '',   # Comments don't have keyword analysis yet
+                    'topic_category': '',
+                    'comment_url': row.get('comment_url', ''),
+                    'timestamp': row.get('timestamp', '')
+                }
+                top_comments.append(action_item)
+                    
+        except FileNotFoundError:
             logger.warning(f"Comments CSV file not found: {comments_csv_file}")
-        
-        # Sort posts by virality score (no date tiebreaker needed for posts)
-        posts.sort(key=lambda x: x['virality_score'], reverse=True)
-        top_posts = posts[:posts_limit]
-        
-        # Sort comments by virality score, then by timestamp (latest first) for tiebreaker
-        def comment_sort_key(comment):
-            try:
-                # Parse ISO timestamp for sorting (latest first)
-                from datetime import datetime
-                timestamp = comment.get('timestamp', '')
-                if timestamp:
-                    parsed_time = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                    return (-comment['virality_score'], -parsed_time.timestamp())
-                else:
-                    return (-comment['virality_score'], 0)
-            except:
-                return (-comment['virality_score'], 0)
-        
-        comments.sort(key=comment_sort_key)
-        top_comments = comments[:comments_limit]
+        except Exception as e:
+            logger.error(f"Error getting action items from comments: {e}")
         
         # Combine both lists
         action_items = top_posts + top_comments
@@ -444,21 +586,18 @@ class DashboardAnalytics:
         Returns:
             Dictionary with AI analysis for each category
         """
-        if not self.ai_overview_file.exists():
+        try:
+            cached_overview = orjson.loads(self.ai_overview_file.read_bytes())
+            logger.info("Loaded AI overview from dashboard_ai_overview.json")
+            return cached_overview.get('data', {
+                'inquiry': ['No AI overview data available'],
+                'praise': ['No AI overview data available'],
+                'complaints': ['No AI overview data available'],
+                'suggestions': ['No AI overview data available']
+            })
+        except FileNotFoundError:
             logger.warning(f"AI overview file not found: {self.ai_overview_file}")
             return -1
-            
-        
-        try:
-            with open(self.ai_overview_file, 'r', encoding='utf-8') as f:
-                cached_overview = json.load(f)
-                logger.info("Loaded AI overview from dashboard_ai_overview.json")
-                return cached_overview.get('data', {
-                    'inquiry': ['No AI overview data available'],
-                    'praise': ['No AI overview data available'],
-                    'complaints': ['No AI overview data available'],
-                    'suggestions': ['No AI overview data available']
-                })
         except Exception as e:
             logger.error(f"Error reading AI overview file: {e}")
             return {
@@ -490,92 +629,55 @@ class DashboardAnalytics:
             }
         
         # Check if we have a cached overview (skip if force_regenerate is True)
-        if not force_regenerate and self.ai_overview_file.exists():
+        if not force_regenerate:
             try:
-                with open(self.ai_overview_file, 'r', encoding='utf-8') as f:
-                    cached_overview = json.load(f)
-                    # Check if it's recent (less than 24 hours old)
-                    cache_time = datetime.fromisoformat(cached_overview.get('timestamp', '1970-01-01'))
-                    if (datetime.now() - cache_time).total_seconds() < 86400:  # 24 hours
-                        logger.info("Using cached AI overview")
-                        return cached_overview['data']
+                cached_overview = orjson.loads(self.ai_overview_file.read_bytes())
+                # Check if it's recent (less than 24 hours old)
+                cache_time = datetime.fromisoformat(cached_overview.get('timestamp', '1970-01-01'))
+                if (datetime.now() - cache_time).total_seconds() < 86400:  # 24 hours
+                    logger.info("Using cached AI overview")
+                    return cached_overview['data']
+            except FileNotFoundError:
+                pass
             except Exception as e:
                 logger.warning(f"Error reading cached overview: {e}")
         
         # Generate new overview
         try:
-            with open(posts_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # Prompt only the highest-virality posts: token cost and latency
+            # scale with prompt length, and the top posts carry the signal.
+            # The raw posts file is only read if the CSV has nothing to offer.
+            top_posts = self.get_top_posts(limit=AI_OVERVIEW_TOP_POSTS)
+            if top_posts:
+                content = "\n\n".join(post['text'] for post in top_posts if post.get('text'))
+            else:
+                with open(posts_file, 'r', encoding='utf-8') as f:
+                    content = f.read()
             
             if not self.api_key:
                 logger.warning("OpenAI API key not found, using fallback analysis")
                 return self._generate_fallback_overview(content)
-              # Use OpenAI to analyze
-            prompt = f"""
-            As an expert AI analyst, analyze the following Facebook posts about Prime Bank from a comprehensive AI perspective. 
-            Provide deep insights about what these posts reveal about Prime Bank's customer relationship, service quality, 
-            and market position. Be specific, detailed, and analytical.
-
-            Format your response as strict JSON only response with the following structure,if the response is not json it won't work. So the response must must must be json only:
-            {{
-                "inquiry": "detailed analysis of customer inquiries with specific patterns and insights",
-                "praise": "detailed analysis of customer praise with specific service strengths identified",
-                "complaints": "detailed analysis of customer complaints with root cause analysis", 
-                "suggestions": "detailed AI-driven recommendations based on customer feedback patterns"
-            }}
-            
-            For each category, provide 6-8 detailed bullet points in React-friendly markdown format. And You should include the name of Prime Bank in the analysis,
-            and the analysis should be specific to Prime Bank's services and customer's opinions.
-            Use **bold** for emphasis and include:
-            
-            INQUIRY ANALYSIS:
-            - Identify specific types of inquiries (account issues, service questions, technical problems)
-            - Analyze inquiry patterns and frequency
-            - Highlight most common customer pain points
-            - Assess the complexity level of customer queries
-            - Evaluate response time expectations from customers
-            - Note any recurring themes or seasonal patterns
             
-            PRAISE ANALYSIS:
-            - Identify specific services or features customers appreciate most
-            - Analyze the language used in positive feedback
-            - Highlight staff performance and customer service quality
-            - Note any exceptional service experiences mentioned
-            - Identify competitive advantages based on customer feedback
-            - Assess customer loyalty indicators in the praise content
-            
-            COMPLAINTS ANALYSIS:
-            - Categorize complaints by type (technical, service, process, communication)
-            - Analyze severity and frequency of different complaint types
-            - Identify systemic issues vs. isolated incidents
-            - Evaluate customer frustration levels and escalation patterns
-            - Note any compliance or regulatory concerns mentioned
-            - Assess potential reputational risks from complaint patterns
-            
-            SUGGESTIONS (AI RECOMMENDATIONS):
-            - Provide actionable recommendations based on customer feedback analysis
-            - Suggest process improvements for most common issues
-            - Recommend technology upgrades or digital solutions
-            - Propose customer experience enhancements
-            - Suggest training programs for staff based on feedback patterns
-            - Recommend proactive communication strategies
-            - Propose competitive positioning improvements
-            
-            Make your analysis sound like it comes from an AI that has deep understanding of banking customer behavior, 
-            service excellence, and digital transformation trends. Be specific about what the data reveals about Prime Bank's position in the market.
-            
-            Posts content:
-            {content}
-            """
+            # Imported here so module import stays cheap for CSV-only
+            # callers; the client is reused so its connection pool keeps
+            # HTTPS connections alive across regenerations
+            if self._openai_client is None:
+                import openai
+                self._openai_client = openai.OpenAI(api_key=self.api_key)
+              # Use OpenAI to analyze
+            prompt = _AI_OVERVIEW_PROMPT.format(content=content)
             
-            response = openai.chat.completions.create(
+            response = self._openai_client.chat.completions.create(
                 model="gpt-4o",
                 messages=[
                     {"role": "system", "content": "You are an expert analyst specializing in customer feedback analysis for banking services.You should give json response only,don't give ```json mark. Just give json response only."},
                     {"role": "user", "content": prompt}
                 ],
-                temperature=0.3
-                #max_tokens=1500
+                temperature=0.3,
+                max_tokens=1500,
+                # Constrain the model to emit a JSON object so the parse
+                # below doesn't fall back on decorated output
+                response_format={"type": "json_object"}
             )
             
             overview_text = response.choices[0].message.content
@@ -591,8 +693,9 @@ class DashboardAnalytics:
                 'data': overview_data
             }
             
-            with open(self.ai_overview_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2, ensure_ascii=False)
+            self.ai_overview_file.write_bytes(
+                orjson.dumps(cache_data, option=orjson.OPT_INDENT_2)
+            )
             
             return overview_data
             
@@ -602,18 +705,23 @@ class DashboardAnalytics:
     
     def _generate_fallback_overview(self, content: str) -> Dict:
         """Generate a detailed fallback overview when OpenAI is not available."""
-        word_count = len(content.split())
-        sentence_count = len([s for s in content.split('.') if s.strip()])
-        
-        # Basic content analysis
-        inquiry_keywords = ['how', 'when', 'where', 'what', 'why', 'can i', 'help', 'support', '?']
-        praise_keywords = ['good', 'great', 'excellent', 'thank', 'appreciate', 'best', 'amazing', 'wonderful']
-        complaint_keywords = ['problem', 'issue', 'error', 'wrong', 'bad', 'terrible', 'slow', 'delay', 'frustrated']
+        # Count matches without materializing a list of every token
+        word_count = sum(1 for _ in _WORD_RE.finditer(content))
+        sentence_count = sum(1 for _ in _SENTENCE_RE.finditer(content))
         
+        # Basic content analysis: one pass over the text collects which
+        # keywords occur at all, then each category counts its hits
         content_lower = content.lower()
-        inquiry_mentions = sum(1 for keyword in inquiry_keywords if keyword in content_lower)
-        praise_mentions = sum(1 for keyword in praise_keywords if keyword in content_lower)
-        complaint_mentions = sum(1 for keyword in complaint_keywords if keyword in content_lower)
+        total_keywords = sum(len(kws) for kws in FALLBACK_KEYWORDS.values())
+        found = set()
+        for match in _FALLBACK_KW_RE.finditer(content_lower):
+            found.add(match.group())
+            if len(found) == total_keywords:
+                break
+        
+        inquiry_mentions = sum(1 for keyword in FALLBACK_KEYWORDS['inquiry'] if keyword in found)
+        praise_mentions = sum(1 for keyword in FALLBACK_KEYWORDS['praise'] if keyword in found)
+        complaint_mentions = sum(1 for keyword in FALLBACK_KEYWORDS['complaint'] if keyword in found)
         
         return {
             'inquiry': f"""- **Customer Inquiry Volume**: Analysis of {word_count} words across {sentence_count} statements reveals {inquiry_mentions} inquiry-related mentions
@@ -9,40 +9,72 @@ Author: Facebook Group Scraper Project
 Date: 2025
 """
 
+import functools
+import importlib.util
 import os
+import queue
+import re
 import sys
 import json
 import subprocess
 import threading
 import time
+from collections import deque
 from pathlib import Path
 from datetime import datetime
-from flask import Flask, request, jsonify
+
+# CSV parser engine: pyarrow's multi-threaded C++ parser when available,
+# otherwise pandas' default single-threaded C parser. find_spec probes
+# without paying the import, which stays deferred to the data endpoints.
+CSV_ENGINE = 'pyarrow' if importlib.util.find_spec('pyarrow') else 'c'
+from flask import Flask, Response, request, jsonify, stream_with_context
+from flask_compress import Compress
 from flask_cors import CORS
+from flask_orjson import OrjsonProvider
+import orjson
 import logging
+from logging.handlers import QueueHandler, QueueListener
 
 # Add the backend directory to Python path
 backend_dir = Path(__file__).parent
 sys.path.insert(0, str(backend_dir))
 
-from dashboard_analytics import DashboardAnalytics
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('flask_dashboard.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# Configure logging through a queue: emitting threads (notably the scraper
+# thread, which logs every pipeline line) only enqueue records, while a
+# single listener thread does the file/stream I/O off the hot path
+_log_queue = queue.SimpleQueue()
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.FileHandler('flask_dashboard.log'),
+    logging.StreamHandler(sys.stdout)
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+logging.getLogger().setLevel(logging.INFO)
+logging.getLogger().addHandler(QueueHandler(_log_queue))
+_log_listener = QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
 logger = logging.getLogger(__name__)
 
 # Initialize Flask app
 app = Flask(__name__)
+app.json = OrjsonProvider(app)  # orjson-backed jsonify for large responses
 CORS(app)  # Enable CORS for frontend requests
+# Compress the JSON payloads on the wire; the dashboard/full_data bodies are
+# mostly repeated keys and text, so brotli/gzip cut them by 5-10x. Brotli
+# level 3 beats gzip on repeated JSON keys at similar CPU cost.
+app.config['COMPRESS_MIMETYPES'] = ['application/json']
+app.config['COMPRESS_LEVEL'] = 4
+app.config['COMPRESS_BR_LEVEL'] = 3
+app.config['COMPRESS_MIN_SIZE'] = 1024
+Compress(app)
+
+# Matches the first integer in a scraper status line (bytes: the scraper
+# stream is parsed in binary mode)
+_NUM_RE = re.compile(rb'\d+')
 
-# Global variables for scraper status
+# Global variables for scraper status; the lock keeps multi-field updates
+# and snapshots consistent between the scraper thread and request threads
 scraper_status = {
     'status': 'idle',  # 'idle', 'running', 'completed', 'failed'
     'last_run': None,
@@ -51,9 +83,67 @@ scraper_status = {
     'comments_scraped': 0,
     'start_time': None
 }
+_status_lock = threading.Lock()
+
+@functools.cache
+def _get_analytics():
+    """Create the shared DashboardAnalytics instance on first use.
+
+    Deferring the import and construction keeps worker boot and
+    health-check-only pods from paying the pandas/analytics startup cost.
+    """
+    from dashboard_analytics import DashboardAnalytics
+    return DashboardAnalytics()
+
+# Cached /api/dashboard payload, keyed by the signatures of the files it is
+# built from so it refreshes whenever the scraper rewrites them. The single
+# (key, data) entry is swapped in one assignment so concurrent request
+# threads never observe a key paired with another key's data
+_DASH_CACHE = {'entry': None}
+
+def _stat_sig(path):
+    """Return the (mtime_ns, size) signature of a file, or None if missing."""
+    try:
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
 
-# Initialize analytics
-analytics = DashboardAnalytics()
+def _dashboard_cache_key():
+    """Build the cache key for the dashboard payload from its source files."""
+    analytics = _get_analytics()
+    return (scraper_status['last_run'],
+            _stat_sig(analytics.csv_dir / "prime_bank_facebook_posts_data.csv"),
+            _stat_sig(analytics.csv_dir / "prime_bank_comments_scraped.csv"),
+            _stat_sig(analytics.posts_dir / "other_banks" / "all_extracted_posts.txt"),
+            _stat_sig(analytics.ai_overview_file))
+
+@functools.lru_cache(maxsize=1)
+def _load_full_data_frames(posts_sig, comments_sig):
+    """Parse the posts/comments CSVs once per on-disk version.
+
+    Keyed on the files' stat signatures so repeat /api/full_data requests
+    reuse the parsed frames until the scraper rewrites the CSVs. The
+    signatures double as existence flags (None means the file is missing).
+    """
+    import pandas as pd
+
+    analytics = _get_analytics()
+    posts_df = None
+    comments_df = None
+    if posts_sig is not None:
+        # dtype=str with keep_default_na=False reproduces DictReader's
+        # all-strings rows for the whole_row payload
+        posts_df = pd.read_csv(analytics.csv_dir / "prime_bank_facebook_posts_data.csv",
+                               dtype=str, keep_default_na=False, engine=CSV_ENGINE)
+    if comments_sig is not None:
+        try:
+            comments_df = pd.read_csv(analytics.csv_dir / "prime_bank_comments_scraped.csv",
+                                      dtype=str, keep_default_na=False,
+                                      encoding='utf-8-sig', engine=CSV_ENGINE)
+        except Exception as e:
+            logger.error(f"Error reading comments CSV: {e}")
+    return posts_df, comments_df
 
 def run_scraper(prime_bank_posts=20, other_banks_posts=15):
     """Run the complete scraper pipeline in a separate thread."""
@@ -65,88 +155,92 @@ def run_scraper(prime_bank_posts=20, other_banks_posts=15):
         logger.info(f"Prime Bank posts: {prime_bank_posts}")
         logger.info(f"Other Banks posts: {other_banks_posts}")
         logger.info("=" * 80)
-        scraper_status['status'] = 'running'
-        scraper_status['start_time'] = datetime.now()
+        with _status_lock:
+            scraper_status['status'] = 'running'
+            scraper_status['start_time'] = datetime.now()
         
-        # Change to backend directory
+        # Run the complete pipeline with post count parameters and stream
+        # output; cwd= keeps the working directory change local to the child
+        # instead of mutating process-global state under serving threads
         backend_dir = Path(__file__).parent
-        os.chdir(str(backend_dir))
-        
-        # Run the complete pipeline with post count parameters and stream output
         process = subprocess.Popen([
             sys.executable, 'complete_pipeline.py',
             '--prime-bank-posts', str(prime_bank_posts),
             '--other-banks-posts', str(other_banks_posts)
-        ], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1, universal_newlines=True)
+        ], cwd=str(backend_dir), stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
         
-        # Stream output in real-time
-        output_lines = []
+        # Stream output in real-time, extracting stats inline so the output
+        # is walked once; only a bounded tail is retained for diagnostics
+        recent_lines = deque(maxlen=500)
+        posts_scraped = None
+        comments_scraped = None
         logger.info("=" * 80)
         logger.info("SCRAPER OUTPUT - REAL-TIME DEBUG:")
         logger.info("=" * 80)
         
+        # The stream is consumed in binary mode: matching runs on bytes and
+        # decoding happens once per kept line instead of for every byte in
+        # the text-mode wrapper
         for line in process.stdout:
             line = line.rstrip()
             if line:  # Only print non-empty lines
-                logger.info(f"[SCRAPER] {line}")
-                output_lines.append(line)
+                text = line.decode('utf-8', 'replace')
+                logger.info("[SCRAPER] %s", text)
+                recent_lines.append(text)
+                lowered = line.lower()
+                if b'posts scraped' in lowered:
+                    # Extract number from line like "24 posts scraped"
+                    match = _NUM_RE.search(line)
+                    if match:
+                        posts_scraped = int(match.group())
+                elif b'comments scraped' in lowered:
+                    match = _NUM_RE.search(line)
+                    if match:
+                        comments_scraped = int(match.group())
         
         # Wait for process to complete
         return_code = process.wait()
-        
-        # Create a result object similar to subprocess.run
-        class ProcessResult:
-            def __init__(self, returncode, stdout):
-                self.returncode = returncode
-                self.stdout = stdout
-        
-        result = ProcessResult(return_code, '\n'.join(output_lines))
-        
+
         end_time = datetime.now()
         duration = (end_time - scraper_status['start_time']).total_seconds()
-        
-        if result.returncode == 0:
+
+        if return_code == 0:
             logger.info("=" * 80)
             logger.info("✅ SCRAPER PIPELINE COMPLETED SUCCESSFULLY")
             logger.info("=" * 80)
-            scraper_status['status'] = 'completed'
-            scraper_status['last_run'] = end_time.isoformat()
-            scraper_status['duration_seconds'] = round(duration)
-            
-            # Try to extract post/comment counts from output
-            try:
-                for line in output_lines:
-                    if 'posts scraped' in line.lower():
-                        # Extract number from line like "Successfully scraped 24 posts"
-                        import re
-                        numbers = re.findall(r'\d+', line)
-                        if numbers:
-                            scraper_status['posts_scraped'] = int(numbers[0])
-                    elif 'comments scraped' in line.lower():
-                        numbers = re.findall(r'\d+', line)
-                        if numbers:
-                            scraper_status['comments_scraped'] = int(numbers[0])
-            except Exception as e:
-                logger.warning(f"Could not extract scraper stats: {e}")
+            with _status_lock:
+                scraper_status['status'] = 'completed'
+                scraper_status['last_run'] = end_time.isoformat()
+                scraper_status['duration_seconds'] = round(duration)
+                # Stats were extracted while streaming; apply what was seen
+                if posts_scraped is not None:
+                    scraper_status['posts_scraped'] = posts_scraped
+                if comments_scraped is not None:
+                    scraper_status['comments_scraped'] = comments_scraped
+            # Fresh CSVs on disk: force the next dashboard request to rebuild
+            _DASH_CACHE['entry'] = None
                 
         else:
             logger.error("=" * 80)
             logger.error("❌ SCRAPER PIPELINE FAILED")
-            logger.error(f"Return code: {result.returncode}")
+            logger.error(f"Return code: {return_code}")
+            logger.error("Last output lines:\n%s", '\n'.join(recent_lines))
             logger.error("=" * 80)
-            scraper_status['status'] = 'failed'
-            scraper_status['last_run'] = end_time.isoformat()
-            scraper_status['duration_seconds'] = round(duration)
+            with _status_lock:
+                scraper_status['status'] = 'failed'
+                scraper_status['last_run'] = end_time.isoformat()
+                scraper_status['duration_seconds'] = round(duration)
             
     except Exception as e:
         logger.error("=" * 80)
         logger.error(f"❌ ERROR RUNNING SCRAPER PIPELINE: {e}")
         logger.error("=" * 80)
-        scraper_status['status'] = 'failed'
-        scraper_status['last_run'] = datetime.now().isoformat()
-        if scraper_status['start_time']:
-            duration = (datetime.now() - scraper_status['start_time']).total_seconds()
-            scraper_status['duration_seconds'] = round(duration)
+        with _status_lock:
+            scraper_status['status'] = 'failed'
+            scraper_status['last_run'] = datetime.now().isoformat()
+            if scraper_status['start_time']:
+                duration = (datetime.now() - scraper_status['start_time']).total_seconds()
+                scraper_status['duration_seconds'] = round(duration)
 
 @app.route('/')
 def index():
@@ -171,18 +265,25 @@ def get_dashboard_data():
         if not request_data or request_data.get('content') != 'give_full_data':
             return jsonify({'error': 'Invalid request. Expected {"content": "give_full_data"}'}), 400
         
-        logger.info("Generating dashboard data...")
-        
-        # Get complete dashboard data
-        dashboard_data = analytics.get_complete_dashboard_data()
+        # Serve the memoized payload unless a source file changed
+        key = _dashboard_cache_key()
+        entry = _DASH_CACHE['entry']
+        if entry is not None and entry[0] == key:
+            dashboard_data = entry[1]
+        else:
+            logger.info("Generating dashboard data...")
+            dashboard_data = _get_analytics().get_complete_dashboard_data()
+            _DASH_CACHE['entry'] = (key, dashboard_data)
+            logger.info("Dashboard data generated successfully")
         
-        # Update scraping status
-        dashboard_data['scraping_status'] = scraper_status.copy()
+        # Update scraping status on a copy so the cached dict stays pristine
+        dashboard_data = dict(dashboard_data)
+        with _status_lock:
+            dashboard_data['scraping_status'] = dict(scraper_status)
         # Remove internal fields
         if 'start_time' in dashboard_data['scraping_status']:
             del dashboard_data['scraping_status']['start_time']
         
-        logger.info("Dashboard data generated successfully")
         return jsonify(dashboard_data)
         
     except Exception as e:
@@ -203,32 +304,45 @@ def reanalyze():
         if not request_data or request_data.get('content') != 'reanalyze':
             return jsonify({'error': 'Invalid request. Expected {"content": "reanalyze"}'}), 400
         
-        if scraper_status['status'] == 'running':
-            return jsonify({'error': 'Scraper is already running'}), 400
-        
         # Get post count parameters (with defaults)
         prime_bank_posts = request_data.get('prime_bank_posts', 20)
         other_banks_posts = request_data.get('other_banks_posts', 15)
-        
+
         # Validate post counts
         try:
             prime_bank_posts = int(prime_bank_posts)
             other_banks_posts = int(other_banks_posts)
-            
+
             if prime_bank_posts < 1 or prime_bank_posts > 200:
                 return jsonify({'error': 'prime_bank_posts must be between 1 and 200'}), 400
             if other_banks_posts < 1 or other_banks_posts > 200:
                 return jsonify({'error': 'other_banks_posts must be between 1 and 200'}), 400
-                
+
         except (ValueError, TypeError):
             return jsonify({'error': 'prime_bank_posts and other_banks_posts must be integers'}), 400
-        
+
+        # Check-then-act under the lock: claim the running state before the
+        # thread starts so two concurrent POSTs cannot both pass the check
+        # and spawn duplicate scraper pipelines
+        with _status_lock:
+            if scraper_status['status'] == 'running':
+                return jsonify({'error': 'Scraper is already running'}), 400
+            scraper_status['status'] = 'running'
+            scraper_status['start_time'] = datetime.now()
+
         logger.info(f"Starting scraper pipeline with {prime_bank_posts} Prime Bank posts and {other_banks_posts} other bank posts...")
-        
+
         # Start scraper in background thread with parameters
         scraper_thread = threading.Thread(target=run_scraper, args=(prime_bank_posts, other_banks_posts))
         scraper_thread.daemon = True
-        scraper_thread.start()
+        try:
+            scraper_thread.start()
+        except Exception:
+            # Release the claimed state so a failed spawn doesn't wedge the
+            # endpoint in 'running'
+            with _status_lock:
+                scraper_status['status'] = 'failed'
+            raise
         
         return jsonify({
             'scraping_status': 'running',
@@ -256,102 +370,115 @@ def get_full_data():
         if not request_data or request_data.get('content') != 'give_full_data':
             return jsonify({'error': 'Invalid request. Expected {"content": "give_full_data"}'}), 400
         
+        import pandas as pd
+        
         # Get CSV data
+        analytics = _get_analytics()
         posts_csv_file = analytics.csv_dir / "prime_bank_facebook_posts_data.csv"
         comments_csv_file = analytics.csv_dir / "prime_bank_comments_scraped.csv"
         
+        posts_sig = _stat_sig(posts_csv_file)
+        comments_sig = _stat_sig(comments_csv_file)
         logger.info(f"Looking for posts CSV at: {posts_csv_file}")
         logger.info(f"Looking for comments CSV at: {comments_csv_file}")
-        logger.info(f"Posts CSV exists: {posts_csv_file.exists()}")
-        logger.info(f"Comments CSV exists: {comments_csv_file.exists()}")
-        
+        logger.info(f"Posts CSV exists: {posts_sig is not None}")
+        logger.info(f"Comments CSV exists: {comments_sig is not None}")
+
         posts_data = []
         comments_data = []
+
+        # The whole_row duplicate of every CSV row roughly doubles the
+        # payload; it is only attached when explicitly requested
+        include_whole_rows = bool(request.args.get('debug'))
+
+        # Parsed frames are shared across requests until the CSVs change
+        df_p, df_c = _load_full_data_frames(posts_sig, comments_sig)
+
+        # Build posts data in bulk: vectorized coercion instead of a
+        # per-row DictReader loop
+        if df_p is not None:
+            reactions = pd.to_numeric(df_p['reaction_count']).astype(int).tolist()
+            comment_counts = pd.to_numeric(df_p['comments_count']).astype(int).tolist()
+            shares = pd.to_numeric(df_p['share_count']).astype(int).tolist()
+            viral_scores = pd.to_numeric(df_p['virality_score'].replace('', '0')).astype(float).tolist()
+            
+            # zip keeps the loop on fast local iteration instead of
+            # repeated list indexing per row
+            for row, reaction, comment_count, share, viral in zip(
+                    df_p.to_dict('records'), reactions, comment_counts, shares, viral_scores):
+                post_data = {
+                    'date': '',  # No timestamp field in posts CSV
+                    'reaction_count': reaction,
+                    'comment_count': comment_count,
+                    'share_count': share,
+                    'text': row.get('text', ''),
+                    'sentiment': row.get('sentiment', ''),
+                    'emotion': row.get('emotion', ''),
+                    'category': row.get('category', ''),
+                    'Viral_score': viral,
+                    'post_routing_id': row.get('post_routing_id', ''),
+                    'post_url': row.get('post_url', '')
+                }
+                if include_whole_rows:
+                    post_data['whole_row'] = row
+                posts_data.append(post_data)
         
-        # Load posts data
-        if posts_csv_file.exists():
-            import csv
-            with open(posts_csv_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                row_count_posts = 0
-                for row in reader:
-                    row_count_posts += 1
-                    # Debug: Check the entire row we're reading for the first few posts
-                    if row_count_posts <= 3:
-                        logger.info(f"Reading post row {row_count_posts}: {row}")
-                    
-                    post_data = {
-                        'date': '',  # No timestamp field in posts CSV
-                        'whole_row':row,  # Include the whole row for debugging
-                        'reaction_count': int(row.get('reaction_count', 0)),
-                        'comment_count': int(row.get('comments_count', 0)),
-                        'share_count': int(row.get('share_count', 0)),
-                        'text': row.get('text', ''),
-                        'sentiment': row.get('sentiment', ''),
-                        'emotion': row.get('emotion', ''),
-                        'category': row.get('category', ''),
-                        'Viral_score': float(row.get('virality_score', 0) or 0),  # Fixed: use correct column name
-                        'post_routing_id': row.get('post_routing_id', ''),
-                        'post_url': row.get('post_url', '')
-                    }
-                    posts_data.append(post_data)
-        
-        # Load comments data
-        if comments_csv_file.exists():
+        # Build comments data the same way, with the virality score computed
+        # vectorized: likes + replies*2
+        if df_c is not None:
             logger.info("Loading comments from CSV...")
-            import csv
             try:
-                with open(comments_csv_file, 'r', encoding='utf-8-sig') as f:
-                    reader = csv.DictReader(f)
-                    row_count = 0
-                    for row in reader:
-                        row_count += 1
-                        
-                        # Debug: Check the entire row we're reading for the first few comments
-                        if row_count <= 3:
-                            logger.info(f"Reading comment row {row_count}: {row}")
-                        
-                        # Calculate virality score for comments: reaction + comment*2
-                        likes_count = int(row.get('likes_count', 0) or 0)
-                        comments_count = int(row.get('comments_count', 0) or 0)
-                        virality_score = likes_count + (comments_count * 2)
-                        
-                        # Debug: Log the calculated virality score
-                        if row_count <= 3:
-                            logger.info(f"Comment row {row_count} - Calculated virality_score: {virality_score}")
-                        
-                        comment_data = {
-                            'whole_row':row,  # Include the whole row for debugging
-                            'post_routing_id': row.get('post_routing_id', ''),
-                            'comment_text': row.get('comment_text', ''),
-                            'comment_author': row.get('author_name', ''),
-                            'comment_time': row.get('timestamp', ''),
-                            'comment_likes': likes_count,
-                            'comment_replies': comments_count,
-                            'comment_url': row.get('comment_url', ''),
-                            'post_url': row.get('post_url', ''),
-                            'comment_id': row.get('comment_id', ''),
-                            'virality_score': virality_score
-                        }
-                        comments_data.append(comment_data)
-                    logger.info(f"Processed {row_count} comment rows")
+                likes = pd.to_numeric(df_c['likes_count'].replace('', '0')).astype(int)
+                replies = pd.to_numeric(df_c['comments_count'].replace('', '0')).astype(int)
+                virality = (likes + replies * 2).tolist()
+                likes = likes.tolist()
+                replies = replies.tolist()
+
+                for row, like, reply, viral in zip(
+                        df_c.to_dict('records'), likes, replies, virality):
+                    comment_data = {
+                        'post_routing_id': row.get('post_routing_id', ''),
+                        'comment_text': row.get('comment_text', ''),
+                        'comment_author': row.get('author_name', ''),
+                        'comment_time': row.get('timestamp', ''),
+                        'comment_likes': like,
+                        'comment_replies': reply,
+                        'comment_url': row.get('comment_url', ''),
+                        'post_url': row.get('post_url', ''),
+                        'comment_id': row.get('comment_id', ''),
+                        'virality_score': viral
+                    }
+                    if include_whole_rows:
+                        comment_data['whole_row'] = row
+                    comments_data.append(comment_data)
+                logger.info(f"Processed {len(comments_data)} comment rows")
             except Exception as e:
-                logger.error(f"Error reading comments CSV: {e}")
+                logger.error(f"Error processing comments CSV: {e}")
         else:
             logger.warning("Comments CSV file not found")
         
         logger.info(f"Loaded {len(posts_data)} posts and {len(comments_data)} comments")
         
-        return jsonify({
-            'Posts': posts_data,
-            'Comments': comments_data,
-            'Summary': {
-                'total_posts': len(posts_data),
-                'total_comments': len(comments_data),
-                'posts_csv_exists': posts_csv_file.exists(),
-                'comments_csv_exists': comments_csv_file.exists()
-            }
-        })
+        summary = {
+            'total_posts': len(posts_data),
+            'total_comments': len(comments_data),
+            'posts_csv_exists': posts_sig is not None,
+            'comments_csv_exists': comments_sig is not None
+        }
+        
+        # Stream the payload row by row instead of serializing one giant
+        # blob: same JSON document, but the first bytes go out immediately
+        # and peak memory stays at one record's worth of serialization
+        def generate():
+            yield b'{"Posts":['
+            for i, record in enumerate(posts_data):
+                yield (b',' if i else b'') + orjson.dumps(record)
+            yield b'],"Comments":['
+            for i, record in enumerate(comments_data):
+                yield (b',' if i else b'') + orjson.dumps(record)
+            yield b'],"Summary":' + orjson.dumps(summary) + b'}'
+        
+        return Response(stream_with_context(generate()), mimetype='application/json')
         
     except Exception as e:
         logger.error(f"Error getting full data: {e}")
@@ -360,7 +487,8 @@ def get_full_data():
 @app.route('/api/status', methods=['GET'])
 def get_scraper_status():
     """Get current scraper status."""
-    status = scraper_status.copy()
+    with _status_lock:
+        status = dict(scraper_status)
     if 'start_time' in status:
         del status['start_time']
     return jsonify(status)
@@ -380,6 +508,8 @@ if __name__ == '__main__':
     
     logger.info(f"Starting Flask Dashboard API on port {port}")
     logger.info(f"Debug mode: {debug}")
-    
+    logger.warning("Werkzeug dev server is for development only; run "
+                   "'gunicorn -c gunicorn.conf.py flask_dashboard_api:app' in production")
+
     # Run the Flask app
     app.run(host='0.0.0.0', port=port, debug=debug)
@@ -0,0 +1,14 @@
+"""Gunicorn configuration for the dashboard API.
+
+Run with: gunicorn -c gunicorn.conf.py flask_dashboard_api:app
+
+Threaded workers keep /api/status polls responsive while a large
+/api/full_data response is streaming from another thread.
+"""
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+workers = 2
+worker_class = 'gthread'
+threads = 8
+timeout = 300
@@ -0,0 +1,5 @@
+"""WSGI entry point for production servers.
+
+Run with: gunicorn -w $(nproc) -k gthread --threads 8 -b 0.0.0.0:8080 wsgi:app
+"""
+from app.main import app  # noqa: F401